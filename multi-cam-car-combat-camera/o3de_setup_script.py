@@ -16,212 +16,65 @@ import azlmbr.entity as entity
 import azlmbr.math as math
 import azlmbr.components as components
 import azlmbr.legacy.general as general
+import hashlib
+import io
 import os
 import json
+from dataclasses import dataclass, fields
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-class O3DECameraSetup:
-    def __init__(self):
-        self.created_entities = {}
-        self.project_path = os.path.dirname(os.path.dirname(editor.EditorToolsApplicationRequestBus(bus.Broadcast, 'GetGameFolder')))
-        print(f"Project path: {self.project_path}")
-        
-    def create_entity(self, name, parent_id=None):
-        """Create a new entity with a given name"""
-        entity_id = editor.ToolsApplicationRequestBus(bus.Broadcast, 'CreateNewEntity', parent_id)
-        editor.EditorEntityAPIBus(bus.Event, 'SetName', entity_id, name)
-        print(f"✓ Created entity: {name}")
-        return entity_id
-    
-    def add_component(self, entity_id, component_type_name):
-        """Add a component to an entity by type name"""
-        component_type = editor.EditorComponentAPIBus(bus.Broadcast, 'FindComponentTypeIdsByEntityType', [component_type_name], 0)
-        
-        if component_type:
-            component = editor.EditorComponentAPIBus(bus.Broadcast, 'AddComponentsOfType', entity_id, component_type)
-            print(f"  ✓ Added component: {component_type_name}")
-            return component[0] if component else None
-        else:
-            print(f"  ✗ Could not find component: {component_type_name}")
-            return None
-    
-    def set_component_property(self, entity_id, component_id, property_path, value):
-        """Set a property on a component"""
-        outcome = editor.EditorComponentAPIBus(bus.Broadcast, 'SetComponentProperty', component_id, property_path, value)
-        if outcome.IsSuccess():
-            print(f"    ✓ Set property: {property_path}")
-        else:
-            print(f"    ✗ Failed to set property: {property_path}")
-        return outcome.IsSuccess()
-    
-    def setup_camera_entity(self):
-        """Create and configure the camera entity"""
-        print("\n=== Setting up Camera Entity ===")
-        
-        camera_id = self.create_entity("VehicleCamera")
-        self.created_entities['camera'] = camera_id
-        
-        # Add Camera component
-        camera_component = self.add_component(camera_id, "Camera")
-        if camera_component:
-            self.set_component_property(camera_id, camera_component, "Field of View", 90.0)
-            self.set_component_property(camera_id, camera_component, "Near Clip Distance", 0.1)
-            self.set_component_property(camera_id, camera_component, "Far Clip Distance", 1000.0)
-        
-        # Set initial position (behind and above origin)
-        transform = math.Transform_CreateTranslation(math.Vector3(0.0, -10.0, 5.0))
-        editor.EditorTransformComponentRequestBus(bus.Event, 'SetWorldTM', camera_id, transform)
-        
-        return camera_id
-    
-    def setup_vehicle_entity(self):
-        """Create and configure a basic vehicle entity"""
-        print("\n=== Setting up Vehicle Entity ===")
-        
-        vehicle_id = self.create_entity("PlayerVehicle")
-        self.created_entities['vehicle'] = vehicle_id
-        
-        # Add mesh component (you'll need to set the mesh asset later)
-        mesh_component = self.add_component(vehicle_id, "Mesh")
-        
-        # Add physics - Rigid Body
-        rigid_body = self.add_component(vehicle_id, "PhysX Rigid Body")
-        if rigid_body:
-            self.set_component_property(vehicle_id, rigid_body, "Initial linear velocity", math.Vector3(0, 0, 0))
-            self.set_component_property(vehicle_id, rigid_body, "Mass", 1500.0)  # Car mass in kg
-        
-        # Add collider
-        collider = self.add_component(vehicle_id, "PhysX Collider")
-        
-        # Set vehicle at origin
-        transform = math.Transform_CreateTranslation(math.Vector3(0.0, 0.0, 1.0))
-        editor.EditorTransformComponentRequestBus(bus.Event, 'SetWorldTM', vehicle_id, transform)
-        
-        return vehicle_id
-    
-    def setup_game_manager(self):
-        """Create game manager entity for camera and menu systems"""
-        print("\n=== Setting up Game Manager ===")
-        
-        manager_id = self.create_entity("GameManager")
-        self.created_entities['manager'] = manager_id
-        
-        # Add Script Canvas or Lua Script component for game logic
-        script_component = self.add_component(manager_id, "Script Canvas")
-        
-        return manager_id
-    
-    def setup_ground_plane(self):
-        """Create a simple ground plane to drive on"""
-        print("\n=== Setting up Ground Plane ===")
-        
-        ground_id = self.create_entity("GroundPlane")
-        self.created_entities['ground'] = ground_id
-        
-        # Add mesh component
-        mesh_component = self.add_component(ground_id, "Mesh")
-        
-        # Add physics collider
-        collider = self.add_component(ground_id, "PhysX Static Rigid Body")
-        box_collider = self.add_component(ground_id, "PhysX Collider")
-        
-        # Scale it up to make a large ground
-        transform = math.Transform_CreateScale(math.Vector3(100.0, 100.0, 1.0))
-        editor.EditorTransformComponentRequestBus(bus.Event, 'SetLocalTM', ground_id, transform)
-        
-        return ground_id
-    
-    def setup_lighting(self):
-        """Set up basic lighting for the scene"""
-        print("\n=== Setting up Lighting ===")
-        
-        # Directional light (sun)
-        light_id = self.create_entity("DirectionalLight")
-        self.created_entities['light'] = light_id
-        
-        light_component = self.add_component(light_id, "Directional Light")
-        
-        # Rotate to angle downward
-        rotation = math.Quaternion_CreateFromEulerAngles(math.Vector3(-45.0, 0.0, 0.0))
-        transform = math.Transform_CreateRotation(rotation)
-        editor.EditorTransformComponentRequestBus(bus.Event, 'SetLocalTM', light_id, transform)
-        
-        return light_id
-    
-    def create_input_bindings(self):
-        """Create input bindings file"""
-        print("\n=== Creating Input Bindings ===")
-        
-        bindings = {
-            "version": 1,
-            "bindings": [
-                {
-                    "name": "camera_cycle",
-                    "event_generator": "keyboard_key_c",
-                    "event_name": "camera_cycle"
-                },
-                {
-                    "name": "camera_look_back",
-                    "event_generator": "gamepad_button_r1",
-                    "event_name": "camera_look_back"
-                },
-                {
-                    "name": "camera_menu",
-                    "event_generator": "keyboard_key_f1",
-                    "event_name": "camera_menu"
-                },
-                {
-                    "name": "photo_mode",
-                    "event_generator": "keyboard_key_f6",
-                    "event_name": "photo_mode"
-                },
-                {
-                    "name": "vehicle_forward",
-                    "event_generator": "keyboard_key_w",
-                    "event_name": "vehicle_forward"
-                },
-                {
-                    "name": "vehicle_backward",
-                    "event_generator": "keyboard_key_s",
-                    "event_name": "vehicle_backward"
-                },
-                {
-                    "name": "vehicle_left",
-                    "event_generator": "keyboard_key_a",
-                    "event_name": "vehicle_left"
-                },
-                {
-                    "name": "vehicle_right",
-                    "event_generator": "keyboard_key_d",
-                    "event_name": "vehicle_right"
-                }
-            ]
+# Generated file contents never change, so they are encoded once at import
+
+# Input bindings file
+_BINDINGS_JSON = json.dumps({
+    "version": 1,
+    "bindings": [
+        {
+            "name": "camera_cycle",
+            "event_generator": "keyboard_key_c",
+            "event_name": "camera_cycle"
+        },
+        {
+            "name": "camera_look_back",
+            "event_generator": "gamepad_button_r1",
+            "event_name": "camera_look_back"
+        },
+        {
+            "name": "camera_menu",
+            "event_generator": "keyboard_key_f1",
+            "event_name": "camera_menu"
+        },
+        {
+            "name": "photo_mode",
+            "event_generator": "keyboard_key_f6",
+            "event_name": "photo_mode"
+        },
+        {
+            "name": "vehicle_forward",
+            "event_generator": "keyboard_key_w",
+            "event_name": "vehicle_forward"
+        },
+        {
+            "name": "vehicle_backward",
+            "event_generator": "keyboard_key_s",
+            "event_name": "vehicle_backward"
+        },
+        {
+            "name": "vehicle_left",
+            "event_generator": "keyboard_key_a",
+            "event_name": "vehicle_left"
+        },
+        {
+            "name": "vehicle_right",
+            "event_generator": "keyboard_key_d",
+            "event_name": "vehicle_right"
         }
-        
-        # Save to project input folder
-        input_folder = os.path.join(self.project_path, "Config", "Input")
-        os.makedirs(input_folder, exist_ok=True)
-        
-        input_file = os.path.join(input_folder, "vehicle_camera.inputbindings")
-        
-        try:
-            with open(input_file, 'w') as f:
-                json.dump(bindings, f, indent=4)
-            print(f"✓ Created input bindings: {input_file}")
-            return True
-        except Exception as e:
-            print(f"✗ Failed to create input bindings: {e}")
-            return False
-    
-    def create_component_source_files(self):
-        """Create the C++ source files for the camera component"""
-        print("\n=== Creating Component Source Files ===")
-        
-        # This creates template files - you'll need to fill in the actual implementation
-        gem_code_path = os.path.join(self.project_path, "Gem", "Code", "Source", "Components")
-        os.makedirs(gem_code_path, exist_ok=True)
-        
-        # Header file template
-        header_content = '''#pragma once
+    ]
+}, indent=4).encode("utf-8")
+
+# Header file template
+_HEADER_TEMPLATE = '''#pragma once
 
 #include <AzCore/Component/Component.h>
 #include <AzCore/Component/TransformBus.h>
@@ -248,10 +101,10 @@ namespace VehicleCombat
         AZ::Vector3 m_currentPosition;
     };
 }
-'''
-        
-        # CPP file template
-        cpp_content = '''#include "VehicleCombatCameraComponent.h"
+'''.encode("utf-8")
+
+# CPP file template
+_CPP_TEMPLATE = '''#include "VehicleCombatCameraComponent.h"
 #include <AzCore/Serialization/SerializeContext.h>
 
 namespace VehicleCombat
@@ -291,34 +144,15 @@ namespace VehicleCombat
             &AZ::TransformBus::Events::SetWorldTranslation, m_currentPosition);
     }
 }
-'''
-        
-        try:
-            header_file = os.path.join(gem_code_path, "VehicleCombatCameraComponent.h")
-            cpp_file = os.path.join(gem_code_path, "VehicleCombatCameraComponent.cpp")
-            
-            with open(header_file, 'w') as f:
-                f.write(header_content)
-            print(f"✓ Created: {header_file}")
-            
-            with open(cpp_file, 'w') as f:
-                f.write(cpp_content)
-            print(f"✓ Created: {cpp_file}")
-            
-            return True
-        except Exception as e:
-            print(f"✗ Failed to create source files: {e}")
-            return False
-    
-    def create_readme(self):
-        """Create a README with next steps"""
-        print("\n=== Creating README ===")
-        
-        readme_content = '''# Vehicle Combat Camera System - Setup Complete!
+'''.encode("utf-8")
+
+# Next steps README
+_README_TEMPLATE = '''# Vehicle Combat Camera System - Setup Complete!
 
 ## What Was Created
 
 ### Entities:
+- **VehicleCameraSetupRoot**: Parent of all the entities below
 - **VehicleCamera**: The camera that will follow your vehicle
 - **PlayerVehicle**: Your vehicle entity (needs mesh and physics setup)
 - **GameManager**: Manages game systems
@@ -410,63 +244,502 @@ Create a Script Canvas graph with:
 3. Documentation: https://www.o3de.org/docs/
 
 Good luck with your Twisted Metal-style game!
-'''
+'''.encode("utf-8")
+
+# Digests of the generated file contents, used to skip rewriting unchanged files
+_BINDINGS_DIGEST = hashlib.blake2b(_BINDINGS_JSON).digest()
+_HEADER_DIGEST = hashlib.blake2b(_HEADER_TEMPLATE).digest()
+_CPP_DIGEST = hashlib.blake2b(_CPP_TEMPLATE).digest()
+_README_DIGEST = hashlib.blake2b(_README_TEMPLATE).digest()
+
+
+@dataclass(slots=True)
+class CreatedEntities:
+    """Entity ids for each role created by the setup"""
+    root: entity.EntityId = None
+    camera: entity.EntityId = None
+    vehicle: entity.EntityId = None
+    manager: entity.EntityId = None
+    ground: entity.EntityId = None
+    light: entity.EntityId = None
+
+
+class O3DECameraSetup:
+    # Project path shared across instances; GetGameFolder only needs to be queried once
+    _cached_project_path = None
+    
+    def __init__(self):
+        self.created_entities = CreatedEntities()
+        self._type_id_cache = {}
+        self._log = io.StringIO()
+        self._transforms = {}
+        self._pending_transforms = []
+        self._file_executor = None
+        self._file_writes = []
+        if O3DECameraSetup._cached_project_path is None:
+            game_folder = editor.EditorToolsApplicationRequestBus(bus.Broadcast, 'GetGameFolder')
+            O3DECameraSetup._cached_project_path = os.path.dirname(os.path.dirname(game_folder))
+        self.project_path = O3DECameraSetup._cached_project_path
+        print(f"Project path: {self.project_path}")
+        
+    def _must(self, ok, step):
+        """Abort the setup if a step reported failure"""
+        if not ok:
+            raise RuntimeError(f"{step} step failed")
+    
+    def _p(self, msg):
+        """Buffer a log line; run_full_setup prints the buffer once at the end"""
+        self._log.write(f"{msg}\n")
+    
+    def flush_log(self):
+        """Print and clear the buffered log"""
+        print(self._log.getvalue(), end="")
+        self._log = io.StringIO()
+    
+    def create_entity(self, name, parent_id=None):
+        """Create a new entity with a given name"""
+        entity_id = editor.ToolsApplicationRequestBus(bus.Broadcast, 'CreateNewEntity', parent_id)
+        editor.EditorEntityAPIBus(bus.Event, 'SetName', entity_id, name)
+        self._p(f"✓ Created entity: {name}")
+        return entity_id
+    
+    def create_entities_bulk(self, specs):
+        """Create several entities from a list of (name, parent_id) tuples.
+        
+        All entities are created before any components are configured so the
+        creation requests go out back-to-back. The editor bindings only expose
+        single-entity CreateNewEntity/SetName, so those are issued per spec.
+        """
+        entity_ids = [editor.ToolsApplicationRequestBus(bus.Broadcast, 'CreateNewEntity', parent_id)
+                      for _, parent_id in specs]
+        for entity_id, (name, _) in zip(entity_ids, specs):
+            editor.EditorEntityAPIBus(bus.Event, 'SetName', entity_id, name)
+        self._p(f"✓ Created entities: {', '.join(name for name, _ in specs)}")
+        return entity_ids
+    
+    def create_scene_entities(self):
+        """Create all setup entities in one batch"""
+        self._p("\n=== Creating Entities ===")
+        
+        # Group everything under one root so the level root stays small
+        root_id = self.create_entity("VehicleCameraSetupRoot", entity.EntityId())
+        self.created_entities.root = root_id
+        
+        specs = [
+            ("VehicleCamera", root_id),
+            ("PlayerVehicle", root_id),
+            ("GameManager", root_id),
+            ("GroundPlane", root_id),
+            ("DirectionalLight", root_id),
+        ]
+        entity_ids = self.create_entities_bulk(specs)
+        created = self.created_entities
+        created.camera, created.vehicle, created.manager, created.ground, created.light = entity_ids
+        
+        return root_id.IsValid() and all(entity_id.IsValid() for entity_id in entity_ids)
+    
+    def find_component_types(self, type_names):
+        """Look up component type ids by name, caching results per type name.
+        
+        Returns None and logs each name that could not be found if any lookup fails.
+        """
+        missing = [name for name in type_names if name not in self._type_id_cache]
+        if missing:
+            type_ids = editor.EditorComponentAPIBus(bus.Broadcast, 'FindComponentTypeIdsByEntityType', missing, 0)
+            if type_ids and len(type_ids) == len(missing):
+                self._type_id_cache.update(zip(missing, type_ids))
+            else:
+                # Can't tell which names resolved, so look them up one at a time
+                for name in missing:
+                    type_id = editor.EditorComponentAPIBus(bus.Broadcast, 'FindComponentTypeIdsByEntityType', [name], 0)
+                    if type_id:
+                        self._type_id_cache[name] = type_id[0]
+        
+        not_found = [name for name in type_names if name not in self._type_id_cache]
+        for name in not_found:
+            self._p(f"  ✗ Could not find component: {name}")
+        if not_found:
+            return None
+        return [self._type_id_cache[name] for name in type_names]
+    
+    def add_component(self, entity_id, component_type_name):
+        """Add a component to an entity by type name"""
+        component_type = self.find_component_types([component_type_name])
+        
+        if component_type:
+            component = editor.EditorComponentAPIBus(bus.Broadcast, 'AddComponentsOfType', entity_id, component_type)
+            if component:
+                self._p(f"  ✓ Added component: {component_type_name}")
+                return component[0]
+            self._p(f"  ✗ Failed to add component: {component_type_name}")
+            return None
+        else:
+            return None
+    
+    def add_components_bulk(self, entity_id, type_names):
+        """Add several components to an entity in one call, returning their component ids in order"""
+        component_types = self.find_component_types(type_names)
+        
+        if component_types:
+            component_ids = editor.EditorComponentAPIBus(bus.Broadcast, 'AddComponentsOfType', entity_id, component_types)
+            if component_ids and len(component_ids) == len(type_names):
+                self._p(f"  ✓ Added components: {', '.join(type_names)}")
+                return list(component_ids)
+            self._p(f"  ✗ Failed to add components: {', '.join(type_names)}")
+            return [None] * len(type_names)
+        else:
+            return [None] * len(type_names)
+    
+    def set_component_property(self, entity_id, component_id, property_path, value):
+        """Set a property on a component"""
+        outcome = editor.EditorComponentAPIBus(bus.Broadcast, 'SetComponentProperty', component_id, property_path, value)
+        return self._report_property_outcomes([property_path], [outcome])
+    
+    def set_component_properties(self, entity_id, component_id, prop_map):
+        """Set several properties on a component from a {property_path: value} dict"""
+        outcomes = [editor.EditorComponentAPIBus(bus.Broadcast, 'SetComponentProperty', component_id, property_path, value)
+                    for property_path, value in prop_map.items()]
+        return self._report_property_outcomes(list(prop_map), outcomes)
+    
+    def _report_property_outcomes(self, property_paths, outcomes):
+        """Log each property outcome, checking IsSuccess once per outcome"""
+        results = [outcome.IsSuccess() for outcome in outcomes]
+        for property_path, ok in zip(property_paths, results):
+            self._p(f"    ✓ Set property: {property_path}" if ok else f"    ✗ Failed to set property: {property_path}")
+        return all(results)
+    
+    def submit_file_write(self, title, write_fn):
+        """Run a file-writing function on a worker thread so the editor thread isn't blocked.
+        
+        write_fn receives a log callable; its lines are kept with the section
+        title and added to the setup log when the write is joined.
+        """
+        def run():
+            lines = [f"\n=== {title} ==="]
+            ok = write_fn(lines.append)
+            return ok, lines
+        
+        future = self._file_executor.submit(run)
+        self._file_writes.append((title, future))
+        return future
+    
+    def wait_for_file_writes(self):
+        """Wait for all submitted file writes, returning True if every write succeeded"""
+        all_ok = True
+        
+        # Join in submission order so each section is logged in a stable order
+        for title, future in self._file_writes:
+            if future.cancelled():
+                self._p(f"\n=== {title} ===")
+                self._p("✗ Skipped after setup failure")
+                all_ok = False
+                continue
+            ok, lines = future.result()
+            for line in lines:
+                self._p(line)
+            all_ok = all_ok and ok
+        
+        self._file_writes.clear()
+        return all_ok
+    
+    def build_transforms(self):
+        """Compute every entity transform up front, before any bus calls"""
+        self._transforms = {
+            # Behind and above origin
+            'camera': math.Transform_CreateTranslation(math.Vector3(0.0, -10.0, 5.0)),
+            # Vehicle at origin
+            'vehicle': math.Transform_CreateTranslation(math.Vector3(0.0, 0.0, 1.0)),
+            # Scaled up to make a large ground
+            'ground': math.Transform_CreateScale(math.Vector3(100.0, 100.0, 1.0)),
+            # Angled downward
+            'light': math.Transform_CreateRotation(
+                math.Quaternion_CreateFromEulerAngles(math.Vector3(-45.0, 0.0, 0.0))),
+        }
+    
+    def _ensure_dirs(self):
+        """Create the output folders used by the file writers, concurrently since they don't overlap"""
+        folders = [
+            os.path.join(self.project_path, "Config", "Input"),
+            os.path.join(self.project_path, "Gem", "Code", "Source", "Components"),
+        ]
+        futures = [self._file_executor.submit(os.makedirs, folder, exist_ok=True) for folder in folders]
+        for future in futures:
+            future.result()
+    
+    def write_if_changed(self, path, content, digest):
+        """Write content to path unless the file already holds identical bytes.
         
+        Skipping identical rewrites avoids file change notifications that the
+        AssetProcessor would otherwise react to. digest is the blake2b digest of
+        content. Returns True if the file was written.
+        """
         try:
-            readme_file = os.path.join(self.project_path, "CAMERA_SETUP_README.md")
-            with open(readme_file, 'w') as f:
-                f.write(readme_content)
-            print(f"✓ Created: {readme_file}")
-            return True
-        except Exception as e:
-            print(f"✗ Failed to create README: {e}")
+            existing_size = os.stat(path).st_size
+        except FileNotFoundError:
+            existing_size = None
+        
+        # Only read and hash the file when the size already matches
+        if existing_size == len(content):
+            if hashlib.blake2b(Path(path).read_bytes()).digest() == digest:
+                return False
+        Path(path).write_bytes(content)
+        return True
+    
+    def queue_transform(self, entity_id, transform, is_local=False):
+        """Queue a transform to be applied by flush_transforms"""
+        self._pending_transforms.append((entity_id, transform, is_local))
+    
+    def flush_transforms(self):
+        """Apply all queued transforms back-to-back, world transforms first"""
+        world = [(entity_id, tm) for entity_id, tm, is_local in self._pending_transforms if not is_local]
+        local = [(entity_id, tm) for entity_id, tm, is_local in self._pending_transforms if is_local]
+        for entity_id, transform in world:
+            editor.EditorTransformComponentRequestBus(bus.Event, 'SetWorldTM', entity_id, transform)
+        for entity_id, transform in local:
+            editor.EditorTransformComponentRequestBus(bus.Event, 'SetLocalTM', entity_id, transform)
+        self._pending_transforms.clear()
+        self._p(f"✓ Applied {len(world) + len(local)} transforms")
+    
+    def setup_camera_entity(self):
+        """Create and configure the camera entity"""
+        self._p("\n=== Setting up Camera Entity ===")
+        
+        camera_id = self.created_entities.camera
+        
+        # Add Camera component
+        camera_component = self.add_component(camera_id, "Camera")
+        if camera_component is None:
             return False
+        
+        # Set initial position (behind and above origin)
+        self.queue_transform(camera_id, self._transforms['camera'])
+        
+        return self.set_component_properties(camera_id, camera_component, {
+            "Field of View": 90.0,
+            "Near Clip Distance": 0.1,
+            "Far Clip Distance": 1000.0,
+        })
+    
+    def setup_vehicle_entity(self):
+        """Create and configure a basic vehicle entity"""
+        self._p("\n=== Setting up Vehicle Entity ===")
+        
+        vehicle_id = self.created_entities.vehicle
+        
+        # Add mesh (you'll need to set the mesh asset later), rigid body and collider
+        vehicle_components = self.add_components_bulk(
+            vehicle_id, ["Mesh", "PhysX Rigid Body", "PhysX Collider"])
+        if any(component is None for component in vehicle_components):
+            return False
+        mesh_component, rigid_body, collider = vehicle_components
+        
+        # Set vehicle at origin
+        self.queue_transform(vehicle_id, self._transforms['vehicle'])
+        
+        return self.set_component_properties(vehicle_id, rigid_body, {
+            "Initial linear velocity": math.Vector3(0, 0, 0),
+            "Mass": 1500.0,  # Car mass in kg
+        })
+    
+    def setup_game_manager(self):
+        """Create game manager entity for camera and menu systems"""
+        self._p("\n=== Setting up Game Manager ===")
+        
+        manager_id = self.created_entities.manager
+        
+        # Add Script Canvas or Lua Script component for game logic
+        script_component = self.add_component(manager_id, "Script Canvas")
+        
+        return script_component is not None
+    
+    def setup_ground_plane(self):
+        """Create a simple ground plane to drive on"""
+        self._p("\n=== Setting up Ground Plane ===")
+        
+        ground_id = self.created_entities.ground
+        
+        # Add mesh component and physics collider
+        ground_components = self.add_components_bulk(
+            ground_id, ["Mesh", "PhysX Static Rigid Body", "PhysX Collider"])
+        if any(component is None for component in ground_components):
+            return False
+        
+        # Scale it up to make a large ground
+        self.queue_transform(ground_id, self._transforms['ground'], is_local=True)
+        
+        return True
+    
+    def setup_lighting(self):
+        """Set up basic lighting for the scene"""
+        self._p("\n=== Setting up Lighting ===")
+        
+        # Directional light (sun)
+        light_id = self.created_entities.light
+        
+        light_component = self.add_component(light_id, "Directional Light")
+        if light_component is None:
+            return False
+        
+        # Rotate to angle downward
+        self.queue_transform(light_id, self._transforms['light'], is_local=True)
+        
+        return True
+    
+    def create_input_bindings(self):
+        """Create input bindings file"""
+        # Save to project input folder
+        input_folder = os.path.join(self.project_path, "Config", "Input")
+        input_file = os.path.join(input_folder, "vehicle_camera.inputbindings")
+        
+        def write_bindings(log):
+            try:
+                if self.write_if_changed(input_file, _BINDINGS_JSON, _BINDINGS_DIGEST):
+                    log(f"✓ Created input bindings: {input_file}")
+                else:
+                    log(f"✓ Input bindings unchanged: {input_file}")
+                return True
+            except Exception as e:
+                log(f"✗ Failed to create input bindings: {e}")
+                return False
+        
+        return self.submit_file_write("Creating Input Bindings", write_bindings)
+    
+    def create_component_source_files(self):
+        """Create the C++ source files for the camera component"""
+        # This creates template files - you'll need to fill in the actual implementation
+        gem_code_path = os.path.join(self.project_path, "Gem", "Code", "Source", "Components")
+        
+        def write_source_files(log):
+            try:
+                header_file = os.path.join(gem_code_path, "VehicleCombatCameraComponent.h")
+                cpp_file = os.path.join(gem_code_path, "VehicleCombatCameraComponent.cpp")
+                
+                if self.write_if_changed(header_file, _HEADER_TEMPLATE, _HEADER_DIGEST):
+                    log(f"✓ Created: {header_file}")
+                else:
+                    log(f"✓ Unchanged: {header_file}")
+                
+                if self.write_if_changed(cpp_file, _CPP_TEMPLATE, _CPP_DIGEST):
+                    log(f"✓ Created: {cpp_file}")
+                else:
+                    log(f"✓ Unchanged: {cpp_file}")
+                
+                return True
+            except Exception as e:
+                log(f"✗ Failed to create source files: {e}")
+                return False
+        
+        return self.submit_file_write("Creating Component Source Files", write_source_files)
+    
+    def create_readme(self):
+        """Create a README with next steps"""
+        def write_readme(log):
+            try:
+                readme_file = os.path.join(self.project_path, "CAMERA_SETUP_README.md")
+                if self.write_if_changed(readme_file, _README_TEMPLATE, _README_DIGEST):
+                    log(f"✓ Created: {readme_file}")
+                else:
+                    log(f"✓ Unchanged: {readme_file}")
+                return True
+            except Exception as e:
+                log(f"✗ Failed to create README: {e}")
+                return False
+        
+        return self.submit_file_write("Creating README", write_readme)
     
     def run_full_setup(self):
         """Run the complete setup process"""
-        print("="*60)
-        print("O3DE Vehicle Combat Camera System - Automated Setup")
-        print("="*60)
+        self._p("="*60)
+        self._p("O3DE Vehicle Combat Camera System - Automated Setup")
+        self._p("="*60)
+        
+        # File writers run on a pool owned by this run and joined before it returns
+        self._file_executor = ThreadPoolExecutor(max_workers=3)
         
         try:
-            # Create entities
-            self.setup_camera_entity()
-            self.setup_vehicle_entity()
-            self.setup_game_manager()
-            self.setup_ground_plane()
-            self.setup_lighting()
+            # Create the output folders once for all file writers
+            self._ensure_dirs()
             
-            # Create files
+            # Start the file writes first so they overlap with entity setup
             self.create_input_bindings()
             self.create_component_source_files()
             self.create_readme()
             
-            print("\n" + "="*60)
-            print("✓ SETUP COMPLETE!")
-            print("="*60)
-            print("\nWhat was created:")
-            for name, entity_id in self.created_entities.items():
-                print(f"  • {name}: Entity ID {entity_id}")
+            # Build transforms before the bus calls start
+            self.build_transforms()
+            
+            # Group all entity edits into one undo step and keep the editor
+            # idle loop from refreshing between each bus call
+            idle_was_enabled = general.idle_is_enabled()
+            try:
+                general.idle_enable(False)
+                editor.ToolsApplicationRequestBus(bus.Broadcast, 'BeginUndoBatch', 'VehicleCameraSetup')
+                try:
+                    # Resolve every component type used below in one lookup
+                    required_types = [
+                        "Camera", "Mesh", "PhysX Rigid Body", "PhysX Collider",
+                        "PhysX Static Rigid Body", "Script Canvas", "Directional Light",
+                    ]
+                    self.find_component_types(required_types)
+                    missing_types = [name for name in required_types if name not in self._type_id_cache]
+                    self._must(not missing_types, f"component type lookup (missing: {', '.join(missing_types)})")
+                    
+                    # Create entities
+                    self._must(self.create_scene_entities(), "entity creation")
+                    
+                    # Configure entities, stopping at the first failure
+                    self._must(self.setup_camera_entity(), "camera")
+                    self._must(self.setup_vehicle_entity(), "vehicle")
+                    self._must(self.setup_game_manager(), "game manager")
+                    self._must(self.setup_ground_plane(), "ground plane")
+                    self._must(self.setup_lighting(), "lighting")
+                    
+                    # Apply the transforms queued by the setup steps
+                    self.flush_transforms()
+                finally:
+                    editor.ToolsApplicationRequestBus(bus.Broadcast, 'EndUndoBatch')
+            finally:
+                general.idle_enable(idle_was_enabled)
             
-            print("\nNext Steps:")
-            print("  1. Check the Entity Outliner (right side) - you'll see all entities")
-            print("  2. Read CAMERA_SETUP_README.md in your project folder")
-            print("  3. Add a mesh to the PlayerVehicle entity")
-            print("  4. Set up basic vehicle movement with Script Canvas")
-            print("  5. Make VehicleCamera the active camera")
+            # Wait for the file writes to land before reporting
+            self._must(self.wait_for_file_writes(), "file creation")
             
-            print("\nFiles created:")
-            print(f"  • {os.path.join(self.project_path, 'CAMERA_SETUP_README.md')}")
-            print(f"  • Config/Input/vehicle_camera.inputbindings")
-            print(f"  • Gem/Code/Source/Components/VehicleCombatCameraComponent.*")
+            self._p("\n" + "="*60)
+            self._p("✓ SETUP COMPLETE!")
+            self._p("="*60)
+            self._p("\nWhat was created:")
+            for field in fields(self.created_entities):
+                name, entity_id = field.name, getattr(self.created_entities, field.name)
+                self._p(f"  • {name}: Entity ID {entity_id}")
+            
+            self._p("\nNext Steps:")
+            self._p("  1. Check the Entity Outliner (right side) - you'll see all entities")
+            self._p("  2. Read CAMERA_SETUP_README.md in your project folder")
+            self._p("  3. Add a mesh to the PlayerVehicle entity")
+            self._p("  4. Set up basic vehicle movement with Script Canvas")
+            self._p("  5. Make VehicleCamera the active camera")
+            
+            self._p("\nFiles created:")
+            self._p(f"  • {os.path.join(self.project_path, 'CAMERA_SETUP_README.md')}")
+            self._p(f"  • Config/Input/vehicle_camera.inputbindings")
+            self._p(f"  • Gem/Code/Source/Components/VehicleCombatCameraComponent.*")
             
             return True
             
         except Exception as e:
-            print(f"\n✗ Setup failed with error: {e}")
+            # Drop file writes that haven't started; the setup is already incomplete
+            self._file_executor.shutdown(wait=False, cancel_futures=True)
+            self._p(f"\n✗ Setup failed with error: {e}")
             import traceback
-            traceback.print_exc()
+            self._p(traceback.format_exc().rstrip())
             return False
+        
+        finally:
+            # Let in-flight file writes finish and log their sections before flushing
+            self._file_executor.shutdown(wait=True)
+            if self._file_writes:
+                self.wait_for_file_writes()
+            self.flush_log()
 
 # Main execution
 def main():